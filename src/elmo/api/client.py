@@ -1,11 +1,20 @@
-import copy
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import lru_cache
-from threading import Lock
+from threading import Lock, get_ident
+from urllib.parse import quote_plus, urlencode
 
 from requests import Session
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, ReadTimeout, RequestException
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .. import query as q
 from ..__about__ import __version__
@@ -25,6 +34,140 @@ from .router import Router
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static fields of the "arm/disarm all sectors" commands; only the session ID changes.
+# Bodies are form-encoded once (up to the `sessionId` value) so that each call is a
+# single string concatenation.
+_ARM_ALL = {"CommandType": 1, "ElementsClass": 1, "ElementsIndexes": 1}
+_DISARM_ALL = {"CommandType": 2, "ElementsClass": 1, "ElementsIndexes": 1}
+_ARM_ALL_BODY = f"{urlencode(_ARM_ALL)}&sessionId="
+_DISARM_ALL_BODY = f"{urlencode(_DISARM_ALL)}&sessionId="
+# Static fields of the per-sector commands; `ElementsIndexes` and `sessionId` are
+# added on each call
+_ARM_SECTORS = {"CommandType": 1, "ElementsClass": 9}
+_DISARM_SECTORS = {"CommandType": 2, "ElementsClass": 9}
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Static fields of the per-input commands, form-encoded once
+_EXCLUDE_INPUT_BODY = urlencode({"CommandType": 2, "ElementsClass": 10})
+_INCLUDE_INPUT_BODY = urlencode({"CommandType": 1, "ElementsClass": 10})
+
+# Maximum number of commands sent concurrently; it must not exceed the
+# connection pool size, otherwise connections are discarded after use
+_MAX_CONCURRENT_COMMANDS = 8
+
+# Gateway errors are transient: read endpoints (including the `POST` ones) are retried,
+# while endpoints that change the system state are retried only on connection errors.
+# Read timeouts are never retried: for the long-polling endpoint they are the expected
+# outcome and must surface as `ReadTimeout` after a single attempt.
+_READ_RETRIES = Retry(
+    total=2,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    raise_on_status=False,
+)
+_WRITE_RETRIES = Retry(
+    total=2, backoff_factor=0.3, allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, raise_on_status=False
+)
+
+# Known `Panel` keys returned by the authentication API, converted to snake_case.
+# Unknown keys fall back to `_camel_to_snake_case()`.
+_PANEL_KEY_MAP = {
+    "Description": "description",
+    "LastConnection": "last_connection",
+    "LastDisconnection": "last_disconnection",
+    "Major": "major",
+    "Minor": "minor",
+    "SourceIP": "source_ip",
+    "ConnectionType": "connection_type",
+    "DeviceClass": "device_class",
+    "Revision": "revision",
+    "Build": "build",
+    "Brand": "brand",
+    "Language": "language",
+    "Areas": "areas",
+    "SectorsPerArea": "sectors_per_area",
+    "TotalSectors": "total_sectors",
+    "Inputs": "inputs",
+    "Outputs": "outputs",
+    "Operators": "operators",
+    "SectorsInUse": "sectors_in_use",
+    "Model": "model",
+    "LoginWithoutUserID": "login_without_user_id",
+    "AdditionalInfoSupported": "additional_info_supported",
+    "IsFirePanel": "is_fire_panel",
+}
+
+# Upper bound (in seconds) of the delay applied before polling again after failures
+_POLL_MAX_BACKOFF = 30
+
+
+def _loads(response):
+    """Decode the JSON body of an API response. When `orjson` is installed, the
+    raw bytes are parsed directly, skipping the text decoding done by `requests`.
+
+    Args:
+        response: the `requests.Response` to decode.
+    Raises:
+        ValueError: if the body is not a valid JSON document.
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _build_sector(entry, descriptions):
+    """Build a sector item from an `areas` entry, using `descriptions` to resolve its name."""
+    index = entry["Index"]
+    return {
+        "id": entry["Id"],
+        "index": index,
+        "element": entry["Element"],
+        "name": descriptions.get(index, "Unknown"),
+        "activable": entry.get("Activable", False),
+        "status": entry.get("Active", False),
+    }
+
+
+def _build_input(entry, descriptions):
+    """Build an input item from an `inputs` entry, using `descriptions` to resolve its name."""
+    index = entry["Index"]
+    return {
+        "id": entry["Id"],
+        "index": index,
+        "element": entry["Element"],
+        "name": descriptions.get(index, "Unknown"),
+        "excluded": entry.get("Excluded", False),
+        "status": entry.get("Alarm", False),
+    }
+
+
+def _build_output(entry, descriptions):
+    """Build an output item from an `outputs` entry, using `descriptions` to resolve its name."""
+    index = entry["Index"]
+    return {
+        "id": entry["Id"],
+        "index": index,
+        "element": entry["Element"],
+        "name": descriptions.get(index, "Unknown"),
+        "do_not_require_authentication": entry.get("DoNotRequireAuthentication", False),
+        "control_denied_to_users": entry.get("ControlDeniedToUsers", False),
+        "status": entry.get("Active", False),
+    }
+
+
+# Query dispatch: result key, `Router` endpoint attribute and item builder.
+# Alerts have a dedicated format, so they don't have an item builder.
+_QUERY_TABLE = {
+    q.SECTORS: ("sectors", "sectors", _build_sector),
+    q.INPUTS: ("inputs", "inputs", _build_input),
+    q.OUTPUTS: ("outputs", "outputs", _build_output),
+    q.ALERTS: ("alerts", "status", None),
+}
+
 
 class ElmoClient:
     """ElmoClient class provides all the functionalities to connect
@@ -47,12 +190,42 @@ class ElmoClient:
         self._domain = domain
         self._session = Session()
         self._session_id = session_id
+        # Keep persistent connections to the API host across calls, so that
+        # commands issued while polling don't pay a new TCP/TLS handshake.
+        # Transient gateway errors are retried before being raised as `HTTPError`.
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_READ_RETRIES))
+        self._write_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=_WRITE_RETRIES)
+        self._mount_write_adapter()
+        self._session.headers["Connection"] = "keep-alive"
+        self._session.headers["User-Agent"] = f"econnect-python/{__version__}"
         self._panel = None
+        self._descriptions = None
+        self._descriptions_lock = Lock()
+        self._etags = {}
+        self._poll_failures = 0
         self._lock = Lock()
+        self._lock_owner = None
         # Debug
-        _LOGGER.debug(f"Client | Library version: {__version__}")
-        _LOGGER.debug(f"Client | Router: {self._router._base_url}")
-        _LOGGER.debug(f"Client | Domain: {self._domain}")
+        _LOGGER.debug("Client | Library version: %s", __version__)
+        _LOGGER.debug("Client | Router: %s", self._router._base_url)
+        _LOGGER.debug("Client | Domain: %s", self._domain)
+
+    def _mount_write_adapter(self):
+        """Route the endpoints that change the system state (lock, unlock and commands)
+        to a dedicated connection pool. These calls are not idempotent, so unlike the
+        other `POST` endpoints, they are never retried after a gateway error.
+        Call it again when the router changes.
+        """
+        for endpoint in (self._router.lock, self._router.unlock, self._router.send_command):
+            self._session.mount(endpoint, self._write_adapter)
+
+    @property
+    def resolved_base_url(self):
+        """The base URL used by the client, including any redirect received during the
+        authentication. Store it and pass it as `base_url` to new clients so that
+        their authentication doesn't require the redirect round trip.
+        """
+        return self._router._base_url
 
     def auth(self, username, password):
         """Authenticate the client and retrieves the access token. This method uses
@@ -80,38 +253,58 @@ class ElmoClient:
             # 403: Incorrect username or password
             if err.response.status_code == 403:
                 raise CredentialError
-            raise err
+            raise
 
-        # Store the session_id and the panel details (if available)
-        data = response.json()
-        self._session_id = data["SessionId"]
-        self._panel = {_camel_to_snake_case(k): v for k, v in data.get("Panel", {}).items()}
+        data = _loads(response)
 
-        # Register the redirect URL and try the authentication again
-        if data["Redirect"]:
-            _LOGGER.debug(f"Redirect URL detected: {data['RedirectTo']}")
-            self._router._base_url = data["RedirectTo"]
+        # Register the redirect URL and try the authentication again, unless the
+        # backend is pointing to the host that has just been used
+        if data["Redirect"] and data["RedirectTo"] != self._router._base_url:
+            _LOGGER.info(
+                "Client | Authentication redirected to %s, pass it as `base_url` to skip the redirect next time",
+                data["RedirectTo"],
+            )
+            self._router = Router(data["RedirectTo"])
+            self._mount_write_adapter()
+            # Names cached from the previous host may not belong to this system
+            self.invalidate_descriptions()
             redirect = self._session.get(self._router.auth, params=payload)
             redirect.raise_for_status()
-            data = redirect.json()
-            self._session_id = data["SessionId"]
+            data = _loads(redirect)
+
+        # Store the session_id and the panel details (if available)
+        self._session_id = data["SessionId"]
+        self._panel = {_PANEL_KEY_MAP.get(k) or _camel_to_snake_case(k): v for k, v in data.get("Panel", {}).items()}
 
-        _LOGGER.debug(f"Client | Authentication successful: {_sanitize_session_id(self._session_id)}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Client | Authentication successful: %s", _sanitize_session_id(self._session_id))
         return self._session_id
 
     @require_session
-    def poll(self, ids):
+    def poll(self, ids, timeout=20, backoff=True):
         """Use a long-polling API to identify when something changes in the
-        system. Calling this method blocks the thread for 15 seconds, waiting
-        for a backend response that happens only when the alarm system status
-        changes. Don't call this method from your main thread otherwise the
-        application hangs.
+        system. Calling this method blocks the thread for up to `timeout` seconds
+        (plus the backoff delay described below, up to 30 seconds), waiting for a
+        backend response that happens only when the alarm system status changes.
+        Don't call this method from your main thread otherwise the application hangs.
+
+        If the backend doesn't answer within `timeout` seconds, the call returns
+        as if nothing changed so that the caller can poll again. After a failed
+        call, the next one waits for a random delay that grows exponentially with
+        consecutive failures (up to 30 seconds), so that many clients failing at
+        the same time don't hit the backend together when they retry.
 
         When the API returns that something is changed, you must call the
         `client.check()` to update your identifiers. Missing this step means
         that the next time you will call `client.poll()` the API returns immediately
         with an old result.
 
+        Args:
+            ids: a dictionary with the last known ID of each query type.
+            timeout: (optional) seconds to wait for the backend response. The default
+            value is 20, slightly above the backend long-polling window.
+            backoff: (optional) wait before polling again after failures. The default
+            value is True.
         Raises:
             HTTPError: if there is an error raised by the API (not 2xx response).
             ParseError: if the response cannot be parsed because the format is unexpected.
@@ -134,24 +327,42 @@ class ElmoClient:
             "CanElevate": "1",
             "ConnectionStatus": "1",
         }
-        response = self._session.post(self._router.update, data=payload)
-        response.raise_for_status()
+        if backoff and self._poll_failures:
+            # Full jitter: a random delay is enough to spread retries, it's not a security concern
+            delay = random.uniform(0, min(_POLL_MAX_BACKOFF, 2**self._poll_failures))  # nosec B311
+            _LOGGER.debug("Client | Polling failed %s time(s), retrying in %.1fs", self._poll_failures, delay)
+            time.sleep(delay)
+
+        try:
+            response = self._session.post(self._router.update, data=payload, timeout=timeout)
+            response.raise_for_status()
+        except ReadTimeout:
+            # A timeout is the expected long-polling outcome: the backend is reachable
+            self._poll_failures = 0
+            _LOGGER.debug("Client | Polling timed out, no changes detected")
+            return {"has_changes": False, "areas": False, "inputs": False, "outputs": False, "statusadv": False}
+        except RequestException:
+            self._poll_failures += 1
+            raise
+        self._poll_failures = 0
 
         # Don't use state["HasChanges"] because it takes into account also events
         # that this client is ignoring. It forces the device to update too often.
-        state = response.json()
+        state = _loads(response)
         try:
-            update = {
-                "has_changes": state["Areas"] or state["Inputs"] or state["Outputs"] or state["StatusAdv"],
-                "areas": state["Areas"],
-                "inputs": state["Inputs"],
-                "outputs": state["Outputs"],
-                "statusadv": state["StatusAdv"],
-            }
+            areas, inputs, outputs, statusadv = state["Areas"], state["Inputs"], state["Outputs"], state["StatusAdv"]
         except KeyError as err:
             raise ParseError(f"Client | Unable to parse poll response: {err} is missing") from err
 
-        _LOGGER.debug(f"Client | Polling result: {update}")
+        update = {
+            "has_changes": areas or inputs or outputs or statusadv,
+            "areas": areas,
+            "inputs": inputs,
+            "outputs": outputs,
+            "statusadv": statusadv,
+        }
+
+        _LOGGER.debug("Client | Polling result: %s", update)
         return update
 
     @contextmanager
@@ -169,15 +380,21 @@ class ElmoClient:
             CodeError: if used `code` is not valid.
             LockError: if the server is refusing to assign the lock. It could mean
             that an unexpected issue happened, or that another application is
-            holding the lock. It's possible to retry the operation.
+            holding the lock. It's possible to retry the operation. It's also raised
+            if the current thread already holds the lock, instead of deadlocking.
             HTTPError: if there is an error raised by the API (not 2xx response).
         Returns:
             A client instance with an acquired lock.
         """
+        # Acquiring the lock again from the owner thread would block forever
+        if self._lock.locked() and self._lock_owner == get_ident():
+            raise LockError("The lock is already held by this thread.")
+
         # Main units that do not require a userId param, expects userId to be "1"
         payload = {"userId": user_id, "password": code, "sessionId": self._session_id}
         response = self._session.post(self._router.lock, data=payload)
-        _LOGGER.debug(f"Client | Lock response: {response.text}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Client | Lock response: %s", response.text)
 
         try:
             response.raise_for_status()
@@ -188,14 +405,15 @@ class ElmoClient:
             # 401: The token has expired
             if err.response.status_code == 401:
                 raise InvalidToken
-            raise err
+            raise
 
         # A wrong code returns 200 with a fail state
-        body = response.json()
+        body = _loads(response)
         if not body[0]["Successful"]:
             raise CodeError
 
         self._lock.acquire()
+        self._lock_owner = get_ident()
         _LOGGER.debug("Client | Lock successful")
         try:
             yield self
@@ -220,13 +438,15 @@ class ElmoClient:
         """
         payload = {"sessionId": self._session_id}
         response = self._session.post(self._router.unlock, data=payload)
-        _LOGGER.debug(f"Client | Unlock response: {response.text}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Client | Unlock response: %s", response.text)
         response.raise_for_status()
 
         _LOGGER.debug("Client | Unlock successful")
         # Release the lock only in case of success, so that if it fails
         # the owner of the lock can properly unlock the system again
         # (maybe with a retry)
+        self._lock_owner = None
         self._lock.release()
         return True
 
@@ -253,33 +473,15 @@ class ElmoClient:
 
         if sectors:
             # Arm only selected sectors
-            _LOGGER.debug(f"Client | Arming sectors: {sectors}")
-            payload = {
-                "CommandType": 1,
-                "ElementsClass": 9,
-                "ElementsIndexes": sectors,
-                "sessionId": self._session_id,
-            }
+            _LOGGER.debug("Client | Arming sectors: %s", sectors)
+            payload = {**_ARM_SECTORS, "ElementsIndexes": sectors, "sessionId": self._session_id}
         else:
             # Arm ALL sectors
             _LOGGER.debug("Client | Arming all sectors")
-            payload = {
-                "CommandType": 1,
-                "ElementsClass": 1,
-                "ElementsIndexes": 1,
-                "sessionId": self._session_id,
-            }
+            payload = _ARM_ALL_BODY + quote_plus(self._session_id)
 
         # Send the payload to arm sectors
-        response = self._session.post(self._router.send_command, data=payload)
-        _LOGGER.debug(f"Client | Arm response: {response.text}")
-        response.raise_for_status()
-        body = response.json()
-
-        # Errors returns 200 with "Successful == False" JSON key
-        if not body[0]["Successful"]:
-            raise CommandError
-
+        self._send_command(payload)
         _LOGGER.debug("Client | Arm successful")
         return True
 
@@ -306,34 +508,16 @@ class ElmoClient:
 
         if sectors:
             # Disarm only selected sectors
-            _LOGGER.debug(f"Client | Disarming sectors: {sectors}")
-            payload = {
-                "CommandType": 2,
-                "ElementsClass": 9,
-                "ElementsIndexes": sectors,
-                "sessionId": self._session_id,
-            }
+            _LOGGER.debug("Client | Disarming sectors: %s", sectors)
+            payload = {**_DISARM_SECTORS, "ElementsIndexes": sectors, "sessionId": self._session_id}
 
         else:
             # Disarm ALL sectors
             _LOGGER.debug("Client | Disarming all sectors")
-            payload = {
-                "CommandType": 2,
-                "ElementsClass": 1,
-                "ElementsIndexes": 1,
-                "sessionId": self._session_id,
-            }
+            payload = _DISARM_ALL_BODY + quote_plus(self._session_id)
 
         # Send the payload to disarm sectors
-        response = self._session.post(self._router.send_command, data=payload)
-        _LOGGER.debug(f"Client | Disarm response: {response.text}")
-        response.raise_for_status()
-        body = response.json()
-
-        # Errors returns 200 with "Successful == False" JSON key
-        if not body[0]["Successful"]:
-            raise CommandError
-
+        self._send_command(payload)
         _LOGGER.debug("Client | Disarm successful")
         return True
 
@@ -361,37 +545,9 @@ class ElmoClient:
         Returns:
             A boolean if the input has been excluded correctly.
         """
-        payloads = []
-
         # Exclude only selected inputs
-        _LOGGER.debug(f"Client | Excluding inputs: {inputs}")
-        for element in inputs:
-            payloads.append(
-                {
-                    "CommandType": 2,
-                    "ElementsClass": 10,
-                    "ElementsIndexes": element,
-                    "sessionId": self._session_id,
-                }
-            )
-
-        # Excluding multiple inputs requires multiple requests
-        errors = []
-        for payload in payloads:
-            response = self._session.post(self._router.send_command, data=payload)
-            response.raise_for_status()
-
-            # A not existing input returns 200 with a fail state
-            body = response.json()
-            _LOGGER.debug(f"Client | Excluding response: {body}")
-            if not body[0]["Successful"]:
-                errors.append(payload["ElementsIndexes"])
-
-        # Raise an exception if errors are detected
-        if errors:
-            invalid_inputs = ",".join(str(x) for x in errors)
-            raise CommandError("Selected inputs don't exist: {}".format(invalid_inputs))
-
+        _LOGGER.debug("Client | Excluding inputs: %s", inputs)
+        self._send_inputs_command(_EXCLUDE_INPUT_BODY, inputs)
         _LOGGER.debug("Client | Excluding successful")
         return True
 
@@ -419,37 +575,9 @@ class ElmoClient:
         Returns:
             A boolean if the input has been included correctly.
         """
-        payloads = []
-
         # Include only selected inputs
-        _LOGGER.debug(f"Client | Including inputs: {inputs}")
-        for element in inputs:
-            payloads.append(
-                {
-                    "CommandType": 1,
-                    "ElementsClass": 10,
-                    "ElementsIndexes": element,
-                    "sessionId": self._session_id,
-                }
-            )
-
-        # Including multiple inputs requires multiple requests
-        errors = []
-        for payload in payloads:
-            response = self._session.post(self._router.send_command, data=payload)
-            response.raise_for_status()
-
-            # A not existing input returns 200 with a fail state
-            body = response.json()
-            _LOGGER.debug(f"Client | Including response: {body}")
-            if not body[0]["Successful"]:
-                errors.append(payload["ElementsIndexes"])
-
-        # Raise an exception if errors are detected
-        if errors:
-            invalid_inputs = ",".join(str(x) for x in errors)
-            raise CommandError("Selected inputs don't exist: {}".format(invalid_inputs))
-
+        _LOGGER.debug("Client | Including inputs: %s", inputs)
+        self._send_inputs_command(_INCLUDE_INPUT_BODY, inputs)
         _LOGGER.debug("Client | Including successful")
         return True
 
@@ -478,7 +606,7 @@ class ElmoClient:
         """
 
         # Exclude only selected inputs
-        _LOGGER.debug(f"Client | Turning on outputs: {outputs}")
+        _LOGGER.debug("Client | Turning on outputs: %s", outputs)
         payload = {
             "CommandType": 1,
             "ElementsClass": 12,
@@ -487,16 +615,8 @@ class ElmoClient:
         }
 
         # Send turn on request
-        response = self._session.post(self._router.send_command, data=payload)
-        response.raise_for_status()
-        body = response.json()
-
-        # Errors returns 200 with "Successful == False" JSON key
-        if not body[0]["Successful"]:
-            _LOGGER.error(f"Client | Turning on response: {body}")
-            raise CommandError
-
-        _LOGGER.debug(f"Client | Turning on successful with response: {body}")
+        body = self._send_command(payload)
+        _LOGGER.debug("Client | Turning on successful with response: %s", body)
         return True
 
     @require_session
@@ -524,7 +644,7 @@ class ElmoClient:
         """
 
         # Turn off only selected outputs
-        _LOGGER.debug(f"Client | Turning off outputs: {outputs}")
+        _LOGGER.debug("Client | Turning off outputs: %s", outputs)
         payload = {
             "CommandType": 2,
             "ElementsClass": 12,
@@ -533,19 +653,96 @@ class ElmoClient:
         }
 
         # Send turn off request
-        response = self._session.post(self._router.send_command, data=payload)
+        body = self._send_command(payload)
+        _LOGGER.debug("Client | Turning off successful with response: %s", body)
+        return True
+
+    def _post_command(self, payload):
+        """Send a command to the `send_command` endpoint.
+
+        Args:
+            payload: the command, either as a dictionary or as a form-encoded body.
+        Raises:
+            HTTPError: if there is an error raised by the API (not 2xx response).
+        Returns:
+            The parsed response of the command.
+        """
+        response = self._session.post(self._router.send_command, data=payload, headers=_FORM_HEADERS)
         response.raise_for_status()
-        body = response.json()
+        return _loads(response)
+
+    def _send_command(self, payload):
+        """Send a command and verify that it has been executed by the main unit.
+
+        Args:
+            payload: the command, either as a dictionary or as a form-encoded body.
+        Raises:
+            HTTPError: if there is an error raised by the API (not 2xx response).
+            CommandError: if the main unit reports the command as failed.
+        Returns:
+            The parsed response of the command.
+        """
+        body = self._post_command(payload)
+        _LOGGER.debug("Client | Command response: %s", body)
 
         # Errors returns 200 with "Successful == False" JSON key
         if not body[0]["Successful"]:
-            _LOGGER.error(f"Client | Turning on response: {body}")
+            _LOGGER.error("Client | Command failed with response: %s", body)
             raise CommandError
+        return body
 
-        _LOGGER.debug(f"Client | Turning on successful with response: {body}")
-        return True
+    def _send_inputs_command(self, command, inputs):
+        """Send the same command to each of the given inputs. The API accepts only one
+        input per request, so one request is sent for each input.
+
+        Args:
+            command: the form-encoded command, without `ElementsIndexes` and `sessionId`.
+            inputs: list of inputs the command is sent to.
+        Raises:
+            HTTPError: if there is an error raised by the API (not 2xx response).
+            CommandError: if the command fails for any of the given inputs.
+        """
+        session_id = quote_plus(self._session_id)
+        payloads = [f"{command}&ElementsIndexes={element}&sessionId={session_id}" for element in inputs]
+
+        errors = []
+        for element, body in zip(inputs, self._send_commands(payloads)):
+            # A not existing input returns 200 with a fail state
+            _LOGGER.debug("Client | Command response: %s", body)
+            if not body[0]["Successful"]:
+                errors.append(element)
+
+        # Raise an exception if errors are detected
+        if errors:
+            invalid_inputs = ",".join(str(x) for x in errors)
+            raise CommandError("Selected inputs don't exist: {}".format(invalid_inputs))
+
+    def _send_commands(self, payloads):
+        """Send a list of independent commands to the `send_command` endpoint. When
+        more than one payload is given, requests are sent concurrently so that the
+        overall latency is close to a single round trip.
+
+        Args:
+            payloads: list of form-encoded command bodies.
+        Raises:
+            HTTPError: if there is an error raised by the API (not 2xx response).
+        Returns:
+            A list with the parsed response of each command, in the same order
+            of the given `payloads`.
+        """
+        if len(payloads) <= 1:
+            return [self._post_command(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_COMMANDS, len(payloads))) as executor:
+            return list(executor.map(self._post_command, payloads))
+
+    def invalidate_descriptions(self):
+        """Drop the cached sectors, inputs and outputs names, so that the next
+        `query()` retrieves them again from the E-Connect API. Use it when names
+        are changed on the main unit while the client is running.
+        """
+        self._descriptions = None
 
-    @lru_cache(maxsize=1)
     @require_session
     def _get_descriptions(self):
         """Retrieve Sectors and Inputs names to map `Class` and `Index` into a
@@ -558,21 +755,53 @@ class ElmoClient:
             A dictionary having `Class` as key, and a dictionary of strings (`Index`)
             as a value, to map sectors and inputs names.
         """
-        payload = {"sessionId": self._session_id}
-        response = self._session.post(self._router.descriptions, data=payload)
-        response.raise_for_status()
+        descriptions = self._descriptions
+        if descriptions is not None:
+            return descriptions
+
+        # Concurrent callers wait for the first one to fill the cache
+        # instead of retrieving descriptions multiple times
+        with self._descriptions_lock:
+            if self._descriptions is not None:
+                return self._descriptions
+
+            payload = {"sessionId": self._session_id}
+            response = self._session.post(self._router.descriptions, data=payload)
+            response.raise_for_status()
 
-        # Transform the list of items in a dict -> dict of strings
-        descriptions = {}
-        items = response.json()
-        _LOGGER.debug(f"Client | Descriptions response: {items}")
-        for item in items:
-            classes = descriptions.get(item["Class"], {})
-            classes[item["Index"]] = item["Description"]
-            descriptions[item["Class"]] = classes
+            # Transform the list of items in a dict -> dict of strings
+            descriptions = {}
+            items = _loads(response)
+            _LOGGER.debug("Client | Descriptions response: %s", items)
+            for item in items:
+                descriptions.setdefault(item["Class"], {})[item["Index"]] = item["Description"]
 
-        _LOGGER.debug(f"Client | Descriptions retrieved (in-cache): {descriptions}")
-        return descriptions
+            _LOGGER.debug("Client | Descriptions retrieved (in-cache): %s", descriptions)
+            self._descriptions = descriptions
+            return descriptions
+
+    def _load_tagged(self, endpoint, response):
+        """Decode the response of a conditional request. If the backend returns
+        `304 Not Modified`, the body decoded for the previous `ETag` is reused; otherwise
+        the body is decoded and cached if the response includes an `ETag`.
+
+        Raises:
+            ParseError: if the backend returns `304 Not Modified` for a body that isn't cached.
+            ValueError: if the body is not a valid JSON document.
+        Returns:
+            The decoded JSON document.
+        """
+        if response.status_code == 304:
+            if endpoint not in self._etags:
+                raise ParseError(f"Client | Response not modified, but no cached body for: {endpoint}")
+            _LOGGER.debug("Client | Response not modified: %s", endpoint)
+            return self._etags[endpoint][1]
+
+        body = _loads(response)
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            self._etags[endpoint] = (etag, body)
+        return body
 
     @require_session
     def query(self, query):
@@ -598,41 +827,37 @@ class ElmoClient:
             'outputs`: is the key you use to retrieve outputs if that was the query
         """
         # Query detection
-        if query == q.SECTORS:
-            key_group = "sectors"
-            endpoint = self._router.sectors
-            _LOGGER.debug("Client | Querying sectors")
-        elif query == q.INPUTS:
-            key_group = "inputs"
-            endpoint = self._router.inputs
-            _LOGGER.debug("Client | Querying inputs")
-        elif query == q.OUTPUTS:
-            key_group = "outputs"
-            endpoint = self._router.outputs
-            _LOGGER.debug("Client | Querying outputs")
-        elif query == q.ALERTS:
-            endpoint = self._router.status
-            _LOGGER.debug("Client | Querying alerts")
-        elif query == q.PANEL:
+        if query == q.PANEL:
             _LOGGER.debug("Client | Querying panel details (cached)")
+            # Panel values are JSON scalars or flat lists: copying one level is enough
+            panel = {k: v.copy() if isinstance(v, (dict, list)) else v for k, v in (self._panel or {}).items()}
             return {
                 "last_id": 0,
-                "panel": copy.deepcopy(self._panel) if self._panel else {},
+                "panel": panel,
             }
-        else:
+
+        try:
+            key_group, endpoint_name, build_item = _QUERY_TABLE[query]
+        except KeyError:
             # Bail-out if the query is not recognized
             raise QueryNotValid()
 
+        endpoint = getattr(self._router, endpoint_name)
+        _LOGGER.debug("Client | Querying %s", key_group)
+
+        # Send a conditional request if the backend tagged the previous response
+        cached = self._etags.get(endpoint)
+        headers = {"If-None-Match": cached[0]} if cached else None
         try:
-            response = self._session.post(endpoint, data={"sessionId": self._session_id})
+            response = self._session.post(endpoint, data={"sessionId": self._session_id}, headers=headers)
             response.raise_for_status()
         except HTTPError as err:
             # Handle the case when the device is disconnected
             if err.response.status_code == 403 and "Centrale non connessa" in err.response.text:
                 raise DeviceDisconnectedError
-            raise err
+            raise
 
-        if query in [q.SECTORS, q.INPUTS, q.OUTPUTS]:
+        if build_item is not None:
             # Retrieve description or use the cache
             descriptions = self._get_descriptions()
 
@@ -640,8 +865,19 @@ class ElmoClient:
             # `excluded` field is available only on inputs, but to return the same `dict`
             # structure, we default "excluded" as False for sectors. In fact, sectors
             # are never excluded.
-            entries = response.json()
-            _LOGGER.debug(f"Client | Query response: {entries}")
+            try:
+                entries = self._load_tagged(endpoint, response)
+            except ValueError as err:
+                raise ParseError(f"Client | Unable to decode query response: {err}") from err
+            _LOGGER.debug("Client | Query response: %s", entries)
+            # Address potential data inconsistency between cloud data and main unit.
+            # In some installations, they may be out of sync, resulting in the cloud
+            # providing a sector/input/output that doesn't actually exist in the main unit.
+            # This case happens also when all inputs or sectors or outputs are used in the
+            # main unit, but their strings are not synchronized with the cloud.
+            # To handle this, we default the name to "Unknown" if its description
+            # isn't found in the cloud data to prevent KeyError.
+            description = descriptions.get(query, {})
             items = {}
             result = {
                 "last_id": entries[-1]["Id"],
@@ -650,57 +886,18 @@ class ElmoClient:
             try:
                 for entry in entries:
                     if entry["InUse"]:
-                        # Address potential data inconsistency between cloud data and main unit.
-                        # In some installations, they may be out of sync, resulting in the cloud
-                        # providing a sector/input/output that doesn't actually exist in the main unit.
-                        # This case happens also when all inputs or sectors or outputs are used in the
-                        # main unit, but their strings are not synchronized with the cloud.
-                        # To handle this, we default the name to "Unknown" if its description
-                        # isn't found in the cloud data to prevent KeyError.
-                        description = descriptions.get(query, {})
-                        item = {
-                            "id": entry.get("Id"),
-                            "index": entry.get("Index"),
-                            "element": entry.get("Element"),
-                            "name": description.get(entry["Index"], "Unknown"),
-                        }
-
-                        if query == q.SECTORS:
-                            item.update(
-                                {
-                                    "activable": entry.get("Activable", False),
-                                    "status": entry.get("Active", False),
-                                }
-                            )
-                            _LOGGER.debug("Client | Querying sectors")
-                        elif query == q.INPUTS:
-                            item.update(
-                                {
-                                    "excluded": entry.get("Excluded", False),
-                                    "status": entry.get("Alarm", False),
-                                }
-                            )
-                            _LOGGER.debug("Client | Querying inputs")
-                        elif query == q.OUTPUTS:
-                            item.update(
-                                {
-                                    "do_not_require_authentication": entry.get("DoNotRequireAuthentication", False),
-                                    "control_denied_to_users": entry.get("ControlDeniedToUsers", False),
-                                    "status": entry.get("Active", False),
-                                }
-                            )
-                            _LOGGER.debug("Client | Querying outputs")
-
-                        items[entry.get("Index")] = item
+                        item = build_item(entry, description)
+                        items[item["index"]] = item
             except KeyError as err:
                 raise ParseError(f"Client | Unable to parse query response: {err}") from err
 
-            _LOGGER.debug(f"Client | Query parsed successfully: {result}")
+            _LOGGER.debug("Client | Query parsed successfully: %s", result)
             return result
-        elif query == q.ALERTS:
+        else:
+            # Alerts
             try:
                 # Check if the response has the expected format
-                msg = response.json()
+                msg = self._load_tagged(endpoint, response)
                 last_id = msg["StatusUid"]
                 status = msg["PanelLeds"]
                 anomalies = msg["PanelAnomalies"]
@@ -713,13 +910,11 @@ class ElmoClient:
             # Convert the dict to a snake_case one to simplify the usage in other modules, and sort alphabetically
             new_dict = {
                 "last_id": last_id,
-                "alerts": {
-                    i: {"name": _camel_to_snake_case(k), "status": v}
-                    for i, (k, v) in enumerate(sorted(merged_dict.items()))
+                key_group: {
+                    i: {"name": _camel_to_snake_case(k), "status": merged_dict[k]}
+                    for i, k in enumerate(sorted(merged_dict))
                 },
             }
-            _LOGGER.debug(f"Client | Status retrieved: {new_dict}")
+            _LOGGER.debug("Client | Status retrieved: %s", new_dict)
 
             return new_dict
-        else:
-            raise QueryNotValid()  # pragma: no cover
@@ -1,3 +1,5 @@
+from functools import wraps
+
 from requests.exceptions import HTTPError
 
 from .exceptions import InvalidToken, LockNotAcquired, MissingToken
@@ -13,19 +15,19 @@ def require_session(func):
         InvalidToken: if stored `session_id` is not valid (returns 401).
     """
 
-    def func_wrapper(*args, **kwargs):
-        self = args[0]
+    @wraps(func)
+    def func_wrapper(self, *args, **kwargs):
         if self._session_id is None:
             raise MissingToken
         else:
             try:
-                return func(*args, **kwargs)
+                return func(self, *args, **kwargs)
             except HTTPError as e:
                 # Translate 401 into InvalidToken exception
                 # Bubble up any other exception
                 if e.response.status_code == 401:
                     raise InvalidToken
-                raise e
+                raise
 
     return func_wrapper
 
@@ -39,8 +41,8 @@ def require_lock(func):
         LockNotAcquired: if a Lock is not acquired.
     """
 
-    def func_wrapper(*args, **kwargs):
-        self = args[0]
+    @wraps(func)
+    def func_wrapper(self, *args, **kwargs):
         # If the Lock() acquisition succeed it means a locking is not occurring
         # and so bail-out the execution (and release the lock).
         # TODO: Lock() state must be moved outside of this client, so that
@@ -49,12 +51,13 @@ def require_lock(func):
             raise LockNotAcquired("A lock must be acquired via `lock()` method.")
         else:
             try:
-                return func(*args, **kwargs)
+                return func(self, *args, **kwargs)
             except HTTPError as err:
                 # 403: Method has been called without obtaining the server lock
                 if err.response.status_code == 403:
+                    self._lock_owner = None
                     self._lock.release()
                     raise LockNotAcquired("A lock must be acquired via `lock()` method.")
-                raise err
+                raise
 
     return func_wrapper
@@ -7,8 +7,25 @@ from .exceptions import ValidationError
 class Router:
     """API router class that holds a list of endpoints
     grouped by action type.
+
+    Endpoints are plain attributes computed once when the router is created,
+    so that API calls don't rebuild the same URL strings on every access.
     """
 
+    __slots__ = (
+        "_base_url",
+        "auth",
+        "descriptions",
+        "update",
+        "status",
+        "lock",
+        "unlock",
+        "send_command",
+        "sectors",
+        "inputs",
+        "outputs",
+    )
+
     def __init__(self, base_url):
         # Enforce the value is a valid URL behind HTTPS
         # Elmo e-Connect service must kept as default
@@ -18,43 +35,13 @@ class Router:
             raise ValidationError("The schema must be HTTPS")
 
         self._base_url = base_url
-
-    @property
-    def auth(self):
-        return "{}/api/login".format(self._base_url)
-
-    @property
-    def descriptions(self):
-        return "{}/api/strings".format(self._base_url)
-
-    @property
-    def update(self):
-        return "{}/api/updates".format(self._base_url)
-
-    @property
-    def status(self):
-        return "{}/api/statusadv".format(self._base_url)
-
-    @property
-    def lock(self):
-        return "{}/api/panel/syncLogin".format(self._base_url)
-
-    @property
-    def unlock(self):
-        return "{}/api/panel/syncLogout".format(self._base_url)
-
-    @property
-    def send_command(self):
-        return "{}/api/panel/syncSendCommand".format(self._base_url)
-
-    @property
-    def sectors(self):
-        return "{}/api/areas".format(self._base_url)
-
-    @property
-    def inputs(self):
-        return "{}/api/inputs".format(self._base_url)
-
-    @property
-    def outputs(self):
-        return "{}/api/outputs".format(self._base_url)
+        self.auth = f"{base_url}/api/login"
+        self.descriptions = f"{base_url}/api/strings"
+        self.update = f"{base_url}/api/updates"
+        self.status = f"{base_url}/api/statusadv"
+        self.lock = f"{base_url}/api/panel/syncLogin"
+        self.unlock = f"{base_url}/api/panel/syncLogout"
+        self.send_command = f"{base_url}/api/panel/syncSendCommand"
+        self.sectors = f"{base_url}/api/areas"
+        self.inputs = f"{base_url}/api/inputs"
+        self.outputs = f"{base_url}/api/outputs"
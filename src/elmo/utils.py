@@ -4,6 +4,13 @@ from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Session ID characters that are obfuscated (everything except dashes)
+_RE_SESSION_ID_CHAR = re.compile(r"[^-]")
+
+# Boundaries converted to an underscore in a single pass: camelCased portions,
+# letters followed by digits (and vice versa), and non-alphanumeric characters
+_RE_SNAKE_CASE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[a-z])(?=[0-9])|(?<=[0-9])(?=[a-z])|[^\w]")
+
 
 def _sanitize_session_id(session_id):
     """Obfuscates a session ID, preserving the first 8 characters and dashes.
@@ -17,18 +24,18 @@ def _sanitize_session_id(session_id):
     Returns:
         str: The sanitized session ID.
     """
-    sanitized = session_id[:8] + "".join("-" if char == "-" else "X" for char in session_id[8:])
+    sanitized = session_id[:8] + _RE_SESSION_ID_CHAR.sub("X", session_id[8:])
     return sanitized
 
 
-@lru_cache(maxsize=42)
+@lru_cache(maxsize=None)
 def _camel_to_snake_case(name):
     """
     Convert a CamelCase string to snake_case.
 
-    This function implements an LRU cache to avoid doing the operation multiple times. As
-    it is used with a very limited set of inputs, the cache size is set to 42 as the usual
-    expected input is 21 distinct strings.
+    This function implements a cache to avoid doing the operation multiple times. As
+    it is used with a small, closed set of inputs (the keys returned by the API), the
+    cache is unbounded so that lookups skip the LRU bookkeeping.
 
     Args:
         name (str): The CamelCase string to be converted.
@@ -44,15 +51,9 @@ def _camel_to_snake_case(name):
     if name.isupper():
         return name.lower()
 
-    # Convert camelCased portions to snake_case
-    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
-
-    # Insert underscores between letters and digits
-    name = re.sub("([a-z])([0-9])", r"\1_\2", name)
-    name = re.sub("([0-9])([a-z])", r"\1_\2", name)
-
-    # Replace non-alphanumeric characters (excluding underscores) with underscores
-    name = re.sub(r"[^\w]", "_", name)
+    # Insert underscores at word boundaries and replace non-alphanumeric characters
+    # (excluding underscores) with underscores
+    name = _RE_SNAKE_CASE.sub("_", name)
 
     # Handle the remaining uppercase letters
     name = name.lower()
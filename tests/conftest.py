@@ -5,6 +5,19 @@ from elmo.api.client import ElmoClient
 
 from .fixtures import responses as r
 
+# Routes served by the integration `client` fixture, defined once for the whole session
+_CLIENT_ROUTES = (
+    (responses.GET, "https://example.com/api/login", r.LOGIN),
+    (responses.POST, "https://example.com/api/updates", r.UPDATES),
+    (responses.POST, "https://example.com/api/panel/syncLogin", r.SYNC_LOGIN),
+    (responses.POST, "https://example.com/api/panel/syncLogout", r.SYNC_LOGOUT),
+    (responses.POST, "https://example.com/api/panel/syncSendCommand", r.SYNC_SEND_COMMAND),
+    (responses.POST, "https://example.com/api/strings", r.STRINGS),
+    (responses.POST, "https://example.com/api/areas", r.AREAS),
+    (responses.POST, "https://example.com/api/inputs", r.INPUTS),
+    (responses.POST, "https://example.com/api/outputs", r.OUTPUTS),
+)
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -20,23 +33,16 @@ def client():
     """
     client = ElmoClient(base_url="https://example.com", domain="domain")
     with responses.RequestsMock(assert_all_requests_are_fired=False) as server:
-        server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN, status=200)
-        server.add(responses.POST, "https://example.com/api/updates", body=r.UPDATES, status=200)
-        server.add(responses.POST, "https://example.com/api/panel/syncLogin", body=r.SYNC_LOGIN, status=200)
-        server.add(responses.POST, "https://example.com/api/panel/syncLogout", body=r.SYNC_LOGOUT, status=200)
-        server.add(
-            responses.POST, "https://example.com/api/panel/syncSendCommand", body=r.SYNC_SEND_COMMAND, status=200
-        )
-        server.add(responses.POST, "https://example.com/api/strings", body=r.STRINGS, status=200)
-        server.add(responses.POST, "https://example.com/api/areas", body=r.AREAS, status=200)
-        server.add(responses.POST, "https://example.com/api/inputs", body=r.INPUTS, status=200)
-        server.add(responses.POST, "https://example.com/api/outputs", body=r.OUTPUTS, status=200)
+        for method, url, body in _CLIENT_ROUTES:
+            server.add(method, url, body=body, status=200)
         yield client
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def panel_details():
-    """Returns the panel details object."""
+    """Returns the panel details object. The object is shared across the test session,
+    so tests must not mutate it.
+    """
     return {
         "description": "T-800 1.0.1",
         "last_connection": "01/01/1984 13:27:28",
@@ -6,6 +6,7 @@ primarily when updating the responses for the integration test client, ensuring
 Key Benefits:
     - Central repository of standardized test responses.
     - Promotes consistent and maintainable testing practices.
+    - Bodies are stored as `bytes`, the same type the client decodes from the wire.
 
 Usage:
     1. Import the required response constant from this module:
@@ -17,7 +18,7 @@ Usage:
            # Continue with the test...
 """
 
-LOGIN = """
+LOGIN = b"""
     {
         "SessionId": "00000000-0000-0000-0000-000000000000",
         "Username": "test",
@@ -96,7 +97,15 @@ LOGIN = """
         "PrivacyLink": "/PrivacyAndTerms/v1/Informativa_privacy_econnect_2020_09.pdf",
         "TermsLink": "/PrivacyAndTerms/v1/CONTRATTO_UTILIZZATORE_FINALE_2020_02_07.pdf"
     }"""
-UPDATES = """
+LOGIN_REDIRECT = b"""
+    {
+        "SessionId": "00000000-0000-0000-0000-000000000000",
+        "Domain": "domain",
+        "Redirect": true,
+        "RedirectTo": "https://redirect.example.com"
+    }
+"""
+UPDATES = b"""
     {
         "ConnectionStatus": false,
         "CanElevate": false,
@@ -118,28 +127,28 @@ UPDATES = """
         "HasChanges": true
     }
 """
-SYNC_LOGIN = """[
+SYNC_LOGIN = b"""[
     {
         "Poller": {"Poller": 1, "Panel": 1},
         "CommandId": 5,
         "Successful": true
     }
 ]"""
-SYNC_LOGOUT = """[
+SYNC_LOGOUT = b"""[
     {
         "Poller": {"Poller": 1, "Panel": 1},
         "CommandId": 5,
         "Successful": true
     }
 ]"""
-SYNC_SEND_COMMAND = """[
+SYNC_SEND_COMMAND = b"""[
     {
         "Poller": {"Poller": 1, "Panel": 1},
         "CommandId": 5,
         "Successful": true
     }
 ]"""
-STRINGS = """[
+STRINGS = b"""[
     {
         "AccountId": 1,
         "Class": 9,
@@ -229,7 +238,17 @@ STRINGS = """[
         "Version": "AAAAAAAAgRw="
     }
 ]"""
-AREAS = """[
+STRINGS_LIVING_ROOM = b"""[
+    {
+        "AccountId": 1,
+        "Class": 9,
+        "Index": 0,
+        "Description": "S1 Living Room",
+        "Created": "/Date(1546004120767+0100)/",
+        "Version": "AAAAAAAAgPc="
+    }
+]"""
+AREAS = b"""[
    {
        "Active": true,
        "ActivePartial": false,
@@ -283,7 +302,7 @@ AREAS = """[
        "InProgress": false
    }
 ]"""
-INPUTS = """[
+INPUTS = b"""[
    {
        "Alarm": true,
        "MemoryAlarm": false,
@@ -333,7 +352,7 @@ INPUTS = """[
        "InProgress": false
    }
 ]"""
-OUTPUTS = """[
+OUTPUTS = b"""[
    {
        "Active": true,
        "InUse": true,
@@ -1,11 +1,16 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import responses
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, ReadTimeout
+from responses import matchers
+from urllib3.exceptions import ReadTimeoutError
 
 from elmo import query
-from elmo.api.client import ElmoClient
+from elmo.__about__ import __version__
+from elmo.api.client import _PANEL_KEY_MAP, ElmoClient, _loads
 from elmo.api.exceptions import (
     CodeError,
     CommandError,
@@ -18,6 +23,7 @@ from elmo.api.exceptions import (
     QueryNotValid,
 )
 from elmo.systems import ELMO_E_CONNECT, IESS_METRONET
+from elmo.utils import _camel_to_snake_case
 
 from .fixtures import responses as r
 
@@ -75,6 +81,76 @@ def test_client_constructor_with_session_id():
     assert client._session_id == "test"
 
 
+def test_client_constructor_connection_pool():
+    """Should mount a keep-alive connection pool with retries for HTTPS calls."""
+    client = ElmoClient(base_url="https://example.com")
+    adapter = client._session.get_adapter("https://example.com/api/login")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.status_forcelist == [502, 503, 504]
+    assert "POST" in adapter.max_retries.allowed_methods
+    assert client._session.headers["Connection"] == "keep-alive"
+    assert client._session.headers["User-Agent"] == f"econnect-python/{__version__}"
+
+
+def test_client_send_commands_concurrently(mocker):
+    """Should send multiple commands concurrently, returning responses in the same order."""
+    client = ElmoClient(base_url="https://example.com")
+    # Each call waits for the others: the barrier breaks if commands are sent one at a time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def post_command(payload):
+        barrier.wait()
+        return [{"Successful": True, "Payload": payload}]
+
+    mocker.patch.object(client, "_post_command", side_effect=post_command)
+    # Test
+    bodies = client._send_commands(["first", "second", "third"])
+    assert [body[0]["Payload"] for body in bodies] == ["first", "second", "third"]
+
+
+def test_client_retries_read_endpoints_on_gateway_errors(server):
+    """Should retry read-only POST endpoints when the gateway is temporarily unavailable."""
+    server.add(responses.POST, "https://example.com/api/updates", body="Service Unavailable", status=503)
+    server.add(responses.POST, "https://example.com/api/updates", body=r.UPDATES, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    assert client.poll(ids)["has_changes"] is True
+    assert len(server.calls) == 2
+
+
+def test_client_does_not_retry_commands_on_gateway_errors(server):
+    """Should not retry commands because they are not idempotent."""
+    server.add(responses.POST, "https://example.com/api/panel/syncSendCommand", body="Bad Gateway", status=502)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    # Test
+    with client._lock:
+        with pytest.raises(HTTPError):
+            client.arm()
+    assert len(server.calls) == 1
+
+
+def test_client_redirect_does_not_retry_commands(server):
+    """Should keep commands out of the retry policy after a redirect to a new host."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
+    server.add(responses.GET, "https://redirect.example.com/api/login", body=r.LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    # Test
+    client.auth("test", "test")
+    adapter = client._session.get_adapter("https://redirect.example.com/api/panel/syncSendCommand")
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert not adapter.max_retries.status_forcelist
+
+
 def test_client_auth_success(server):
     """Should authenticate with valid credentials."""
     server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN, status=200)
@@ -204,14 +280,6 @@ def test_client_auth_unknown_error(server):
 
 def test_client_auth_redirect(server):
     """Should update the client Router if a redirect is required."""
-    redirect = """
-        {
-            "SessionId": "00000000-0000-0000-0000-000000000000",
-            "Domain": "domain",
-            "Redirect": true,
-            "RedirectTo": "https://redirect.example.com"
-        }
-    """
     login = """
         {
             "SessionId": "99999999-9999-9999-9999-999999999999",
@@ -229,7 +297,7 @@ def test_client_auth_redirect(server):
             "IsElevation": false
         }
     """
-    server.add(responses.GET, "https://example.com/api/login", body=redirect, status=200)
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
     server.add(responses.GET, "https://redirect.example.com/api/login", body=login, status=200)
     client = ElmoClient(base_url="https://example.com", domain="domain")
     # Test
@@ -239,21 +307,97 @@ def test_client_auth_redirect(server):
     assert len(server.calls) == 2
 
 
-def test_client_auth_infinite_redirect(server):
-    """Should prevent infinite redirects in the auth() call."""
+def test_client_auth_redirect_stores_panel_details(server):
+    """Should store the panel details returned by the redirected authentication."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
+    server.add(responses.GET, "https://redirect.example.com/api/login", body=r.LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    # Test
+    client.auth("test", "test")
+    assert client._panel["description"] == "T-800 1.0.1"
+    assert client._panel["total_sectors"] == 16
+
+
+def test_client_panel_key_map_matches_conversion():
+    """Should map known panel keys to the same value of the generic conversion."""
+    for key, value in _PANEL_KEY_MAP.items():
+        assert _camel_to_snake_case(key) == value
+
+
+def test_client_auth_converts_unknown_panel_keys(server):
+    """Should convert panel keys that are not known in advance."""
+    login = """
+        {
+            "SessionId": "00000000-0000-0000-0000-000000000000",
+            "Redirect": false,
+            "Panel": {"Description": "T-800 1.0.1", "FutureFieldV2": true}
+        }
+    """
+    server.add(responses.GET, "https://example.com/api/login", body=login, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    # Test
+    client.auth("test", "test")
+    assert client._panel == {"description": "T-800 1.0.1", "future_field_v2": True}
+
+
+def test_client_auth_redirect_invalidates_descriptions(server):
+    """Should drop cached descriptions when the authentication is redirected to another host."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
+    server.add(responses.GET, "https://redirect.example.com/api/login", body=r.LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._descriptions = {9: {0: "Living Room"}}
+    # Test
+    client.auth("test", "test")
+    assert client._descriptions is None
+
+
+def test_client_auth_redirect_to_same_host(server):
+    """Should not authenticate again if the redirect points to the host already used."""
     redirect = """
         {
             "SessionId": "00000000-0000-0000-0000-000000000000",
             "Domain": "domain",
             "Redirect": true,
-            "RedirectTo": "https://redirect.example.com"
+            "RedirectTo": "https://example.com"
         }
     """
     server.add(responses.GET, "https://example.com/api/login", body=redirect, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    # Test
+    assert client.auth("test", "test") == "00000000-0000-0000-0000-000000000000"
+    assert client._router._base_url == "https://example.com"
+    assert len(server.calls) == 1
+
+
+def test_client_auth_redirect_logs_resolved_url(server, caplog):
+    """Should suggest the resolved base URL when the authentication is redirected."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
+    server.add(responses.GET, "https://redirect.example.com/api/login", body=r.LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    caplog.set_level(logging.INFO)
+    # Test
+    client.auth("test", "test")
+    assert "Authentication redirected to https://redirect.example.com" in caplog.text
+
+
+def test_client_resolved_base_url(server):
+    """Should expose the base URL resolved after an authentication redirect."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
+    server.add(responses.GET, "https://redirect.example.com/api/login", body=r.LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    assert client.resolved_base_url == "https://example.com"
+    # Test
+    client.auth("test", "test")
+    assert client.resolved_base_url == "https://redirect.example.com"
+
+
+def test_client_auth_infinite_redirect(server):
+    """Should prevent infinite redirects in the auth() call."""
+    server.add(responses.GET, "https://example.com/api/login", body=r.LOGIN_REDIRECT, status=200)
     server.add(
         responses.GET,
         "https://redirect.example.com/api/login",
-        body=redirect,
+        body=r.LOGIN_REDIRECT,
         status=200,
     )
     client = ElmoClient(base_url="https://example.com", domain="domain")
@@ -452,6 +596,134 @@ def test_client_poll_unknown_error(server):
     assert len(server.calls) == 1
 
 
+def test_client_poll_timeout(server):
+    """Should return no changes if the long-polling request times out."""
+    server.add(responses.POST, "https://example.com/api/updates", body=ReadTimeout())
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    assert client.poll(ids, timeout=1) == {
+        "has_changes": False,
+        "areas": False,
+        "inputs": False,
+        "outputs": False,
+        "statusadv": False,
+    }
+    assert len(server.calls) == 1
+    assert server.calls[0].request.req_kwargs["timeout"] == 1
+
+
+def test_client_poll_backoff_after_failures(server, mocker):
+    """Should wait for a growing random delay before polling again after failures."""
+    server.add(responses.POST, "https://example.com/api/updates", body="Server Error", status=500)
+    server.add(responses.POST, "https://example.com/api/updates", body="Server Error", status=500)
+    server.add(responses.POST, "https://example.com/api/updates", body=r.UPDATES, status=200)
+    mocked_sleep = mocker.patch("elmo.api.client.time.sleep")
+    mocked_uniform = mocker.patch("elmo.api.client.random.uniform", return_value=1)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    with pytest.raises(HTTPError):
+        client.poll(ids)
+    assert mocked_sleep.call_count == 0
+    with pytest.raises(HTTPError):
+        client.poll(ids)
+    mocked_uniform.assert_called_with(0, 2)
+    client.poll(ids)
+    mocked_uniform.assert_called_with(0, 4)
+    assert mocked_sleep.call_count == 2
+    assert client._poll_failures == 0
+
+
+def test_client_poll_timeout_resets_backoff(server, mocker):
+    """Should reset the failures counter when the long-polling call times out."""
+    server.add(responses.POST, "https://example.com/api/updates", body=ReadTimeout())
+    mocker.patch("elmo.api.client.time.sleep")
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._poll_failures = 3
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    assert client.poll(ids)["has_changes"] is False
+    assert client._poll_failures == 0
+
+
+def test_client_poll_timeout_through_retry_policy(mocker):
+    """Should not retry a long-polling read timeout, so that it's reported as no changes."""
+    mocked_request = mocker.patch(
+        "urllib3.connectionpool.HTTPConnectionPool._make_request",
+        side_effect=ReadTimeoutError(None, "https://example.com/api/updates", "Read timed out."),
+    )
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._poll_failures = 1
+    mocker.patch("elmo.api.client.time.sleep")
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    assert client.poll(ids)["has_changes"] is False
+    assert mocked_request.call_count == 1
+    assert client._poll_failures == 0
+
+
+def test_client_poll_backoff_is_capped(server, mocker):
+    """Should cap the backoff delay to the maximum allowed value."""
+    server.add(responses.POST, "https://example.com/api/updates", body=r.UPDATES, status=200)
+    mocker.patch("elmo.api.client.time.sleep")
+    mocked_uniform = mocker.patch("elmo.api.client.random.uniform", return_value=1)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._poll_failures = 10
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    client.poll(ids)
+    mocked_uniform.assert_called_once_with(0, 30)
+
+
+def test_client_poll_backoff_disabled(server, mocker):
+    """Should not wait before polling if the backoff is disabled."""
+    server.add(responses.POST, "https://example.com/api/updates", body=r.UPDATES, status=200)
+    mocked_sleep = mocker.patch("elmo.api.client.time.sleep")
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._poll_failures = 3
+    ids = {
+        query.SECTORS: 42,
+        query.INPUTS: 4242,
+        query.OUTPUTS: 424,
+        query.ALERTS: 424242,
+    }
+    # Test
+    client.poll(ids, backoff=False)
+    assert mocked_sleep.call_count == 0
+
+
 class TestClientPollParseError:
     def test_areas_missing(self, server):
         """Should raise a ParseError if the response is different from what is expected.
@@ -622,6 +894,59 @@ def test_client_lock(server, mocker):
     assert server.calls[0].request.body == "userId=1&password=test&sessionId=test"
 
 
+def test_client_lock_logs_response_in_debug(server, mocker, caplog):
+    """Should log the lock response only when debug logging is enabled."""
+    server.add(responses.POST, "https://example.com/api/panel/syncLogin", body=r.SYNC_LOGIN, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "unlock")
+    # Test
+    caplog.set_level(logging.INFO)
+    with client.lock("test"):
+        pass
+    assert "Lock response" not in caplog.text
+    client._lock.release()
+    caplog.set_level(logging.DEBUG)
+    with client.lock("test"):
+        pass
+    assert '"CommandId": 5' in caplog.text
+
+
+def test_client_lock_nested_fails_fast(server, mocker):
+    """Should raise LockError if the thread that holds the lock tries to acquire it again."""
+    server.add(responses.POST, "https://example.com/api/panel/syncLogin", body=r.SYNC_LOGIN, status=200)
+    server.add(responses.POST, "https://example.com/api/panel/syncLogout", body=r.SYNC_LOGOUT, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    # Test
+    with client.lock("test"):
+        with pytest.raises(LockError):
+            with client.lock("test"):
+                pass
+    assert len(server.calls) == 2
+    assert not client._lock.locked()
+
+
+def test_client_lock_previous_owner_waits(server):
+    """Should wait for the lock, instead of failing, if the previous owner locks again
+    while another thread holds the lock."""
+    server.add(responses.POST, "https://example.com/api/panel/syncLogin", body=r.SYNC_LOGIN, status=200)
+    server.add(responses.POST, "https://example.com/api/panel/syncLogout", body=r.SYNC_LOGOUT, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    with client.lock("test"):
+        pass
+    assert client._lock_owner is None
+    # Another thread holds the lock and releases it shortly after
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(client._lock.acquire).result()
+    threading.Timer(0.1, client._lock.release).start()
+    # Test
+    with client.lock("test"):
+        assert client._lock_owner == threading.get_ident()
+    assert not client._lock.locked()
+
+
 def test_client_lock_with_user_id(server, mocker):
     """Should acquire the lock sending a user-defined `userId`."""
     html = """[
@@ -858,6 +1183,7 @@ def test_client_arm(server):
     assert "ElementsClass=1" in body
     assert "ElementsIndexes=1" in body
     assert "sessionId=test" in body
+    assert server.calls[0].request.headers["Content-Type"] == "application/x-www-form-urlencoded"
 
 
 def test_client_arm_single_sector(server):
@@ -1010,6 +1336,7 @@ def test_client_disarm(server):
     assert "ElementsClass=1" in body
     assert "ElementsIndexes=1" in body
     assert "sessionId=test" in body
+    assert server.calls[0].request.headers["Content-Type"] == "application/x-www-form-urlencoded"
 
 
 def test_client_disarm_single_sector(server):
@@ -1187,18 +1514,46 @@ def test_client_include_multiple_inputs(server):
     # Test
     assert client.include([3, 4]) is True
     assert len(server.calls) == 2
-    body = server.calls[0].request.body.split("&")
+    # Requests are sent concurrently, so their order is not guaranteed
+    bodies = sorted(call.request.body for call in server.calls)
+    body = bodies[0].split("&")
     assert "CommandType=1" in body
     assert "ElementsClass=10" in body
     assert "ElementsIndexes=3" in body
     assert "sessionId=test" in body
-    body = server.calls[1].request.body.split("&")
+    body = bodies[1].split("&")
     assert "CommandType=1" in body
     assert "ElementsClass=10" in body
     assert "ElementsIndexes=4" in body
     assert "sessionId=test" in body
 
 
+def test_client_include_multiple_inputs_reports_failures(server):
+    """Should report only the inputs that failed when multiple inputs are included."""
+    success = '[{"Poller": {"Poller": 1, "Panel": 1}, "CommandId": 147, "Successful": true}]'
+    failure = '[{"Poller": {"Poller": 1, "Panel": 1}, "CommandId": 147, "Successful": false}]'
+    for index, body in ((3, success), (4, failure), (5, failure)):
+        server.add(
+            responses.POST,
+            "https://example.com/api/panel/syncSendCommand",
+            body=body,
+            status=200,
+            match=[
+                matchers.urlencoded_params_matcher(
+                    {"CommandType": "1", "ElementsClass": "10", "ElementsIndexes": str(index), "sessionId": "test"}
+                )
+            ],
+        )
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._lock.acquire()
+    # Test
+    with pytest.raises(CommandError) as excinfo:
+        client.include([3, 4, 5])
+    assert str(excinfo.value) == "Selected inputs don't exist: 4,5"
+    assert len(server.calls) == 3
+
+
 def test_client_include_fails_missing_lock(server):
     """include() should fail without calling the endpoint if Lock() has not been acquired."""
     client = ElmoClient(base_url="https://example.com", domain="domain")
@@ -1672,19 +2027,7 @@ def test_client_get_descriptions(server):
 
 def test_client_get_descriptions_cached(server):
     """Should cache the result of get_descriptions()."""
-    html = """
-    [
-      {
-        "AccountId": 1,
-        "Class": 9,
-        "Index": 0,
-        "Description": "S1 Living Room",
-        "Created": "/Date(1546004120767+0100)/",
-        "Version": "AAAAAAAAgPc="
-      }
-    ]
-    """
-    server.add(responses.POST, "https://example.com/api/strings", body=html, status=200)
+    server.add(responses.POST, "https://example.com/api/strings", body=r.STRINGS_LIVING_ROOM, status=200)
     client = ElmoClient(base_url="https://example.com", domain="domain")
     client._session_id = "test"
     # Test
@@ -1693,6 +2036,45 @@ def test_client_get_descriptions_cached(server):
     assert len(server.calls) == 1
 
 
+def test_client_get_descriptions_concurrent(server):
+    """Should retrieve descriptions only once when called concurrently."""
+    server.add(responses.POST, "https://example.com/api/strings", body=r.STRINGS_LIVING_ROOM, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    # Test
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: client._get_descriptions(), range(4)))
+    assert all(result == {9: {0: "S1 Living Room"}} for result in results)
+    assert len(server.calls) == 1
+
+
+def test_client_invalidate_descriptions(server):
+    """Should retrieve descriptions again after the cache is invalidated."""
+    server.add(responses.POST, "https://example.com/api/strings", body=r.STRINGS_LIVING_ROOM, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    # Test
+    client._get_descriptions()
+    client.invalidate_descriptions()
+    assert client._descriptions is None
+    assert client._get_descriptions() == {9: {0: "S1 Living Room"}}
+    assert len(server.calls) == 2
+
+
+def test_client_get_descriptions_cached_per_instance(server):
+    """Should not share the descriptions cache between client instances."""
+    server.add(responses.POST, "https://example.com/api/strings", body=r.STRINGS_LIVING_ROOM, status=200)
+    first = ElmoClient(base_url="https://example.com", domain="domain")
+    first._session_id = "test"
+    second = ElmoClient(base_url="https://example.com", domain="domain")
+    second._session_id = "test"
+    # Test
+    first._get_descriptions()
+    second._get_descriptions()
+    assert first._descriptions == second._descriptions
+    assert len(server.calls) == 2
+
+
 def test_client_get_descriptions_unauthorized(server):
     """Should raise HTTPError if the request is unauthorized."""
     server.add(
@@ -1802,6 +2184,19 @@ def test_client_query_panel_details_deep_copy(panel_details):
     assert details["panel"] is not client._panel
 
 
+def test_client_query_panel_details_nested_copy():
+    """Should copy nested values so that callers can't alter the cached panel."""
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    client._panel = {"description": "T-800 1.0.1", "sectors_in_use": [True, False]}
+    # Test
+    details = client.query(query.PANEL)
+    details["panel"]["sectors_in_use"].append(True)
+    # Expected output
+    assert details["panel"] == {"description": "T-800 1.0.1", "sectors_in_use": [True, False, True]}
+    assert client._panel["sectors_in_use"] == [True, False]
+
+
 def test_client_get_sectors_status(server, mocker):
     """Should query a Elmo system to retrieve sectors status."""
     html = """[
@@ -2349,6 +2744,74 @@ def test_client_get_inputs_missing_area(server, mocker):
     }
 
 
+def test_client_query_not_modified(server, mocker):
+    """Should reuse the previous response when the backend returns 304 Not Modified."""
+    html = """[
+        {"Active": true, "Activable": true, "InUse": true, "Id": 1, "Index": 0, "Element": 1}
+    ]"""
+    server.add(responses.POST, "https://example.com/api/areas", body=html, status=200, headers={"ETag": '"v1"'})
+    server.add(
+        responses.POST,
+        "https://example.com/api/areas",
+        status=304,
+        match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "_get_descriptions")
+    client._get_descriptions.return_value = {9: {0: "Living Room"}}
+    # Test
+    first = client.query(query.SECTORS)
+    second = client.query(query.SECTORS)
+    assert len(server.calls) == 2
+    assert "If-None-Match" not in server.calls[0].request.headers
+    assert server.calls[1].response.status_code == 304
+    assert first == second
+    assert second["sectors"][0]["name"] == "Living Room"
+
+
+def test_client_query_without_etag(server, mocker):
+    """Should not send conditional requests if the backend doesn't return an ETag."""
+    html = """[
+        {"Active": true, "Activable": true, "InUse": true, "Id": 1, "Index": 0, "Element": 1}
+    ]"""
+    server.add(responses.POST, "https://example.com/api/areas", body=html, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "_get_descriptions")
+    client._get_descriptions.return_value = {9: {0: "Living Room"}}
+    # Test
+    client.query(query.SECTORS)
+    client.query(query.SECTORS)
+    assert len(server.calls) == 2
+    assert "If-None-Match" not in server.calls[1].request.headers
+    assert client._etags == {}
+
+
+def test_client_query_not_modified_without_cache(server, mocker):
+    """Should raise a ParseError if the backend returns 304 Not Modified for a body that isn't cached."""
+    server.add(responses.POST, "https://example.com/api/areas", status=304)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "_get_descriptions")
+    client._get_descriptions.return_value = {9: {0: "Living Room"}}
+    # Test
+    with pytest.raises(ParseError):
+        client.query(query.SECTORS)
+
+
+def test_client_query_invalid_json(server, mocker):
+    """Should raise a ParseError if the response is not a valid JSON document."""
+    server.add(responses.POST, "https://example.com/api/areas", body="<html></html>", status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "_get_descriptions")
+    client._get_descriptions.return_value = {9: {0: "Living Room"}}
+    # Test
+    with pytest.raises(ParseError):
+        client.query(query.SECTORS)
+
+
 def test_client_query_not_valid(client):
     """Should raise QueryNotValid if the query is not recognized."""
     client = ElmoClient(base_url="https://example.com", domain="domain")
@@ -2415,6 +2878,26 @@ def test_client_query_invalid_response(server, mocker):
         client.query(query.SECTORS)
 
 
+def test_client_query_missing_element(server, mocker):
+    """Should raise ParseError if an entry in use misses a mandatory field."""
+    html = """[
+       {
+           "Active": true,
+           "Activable": true,
+           "InUse": true,
+           "Id": 1,
+           "Index": 0
+       }
+    ]"""
+    server.add(responses.POST, "https://example.com/api/areas", body=html, status=200)
+    client = ElmoClient(base_url="https://example.com", domain="domain")
+    client._session_id = "test"
+    mocker.patch.object(client, "_get_descriptions")
+    # Test
+    with pytest.raises(ParseError):
+        client.query(query.SECTORS)
+
+
 def test_client_query_unit_disconnected(server, mocker):
     # Ensure that the client catches and raises an exception when the unit is disconnected
     server.add(
@@ -2562,3 +3045,19 @@ def test_client_get_alerts_missing_data(server):
     with pytest.raises(ParseError):
         client.query(query.ALERTS)
     assert len(server.calls) == 1
+
+
+def test_loads_with_orjson(mocker):
+    """Should decode the raw response content with orjson when available."""
+    response = mocker.Mock(content=b'{"SessionId": "test"}')
+    assert _loads(response) == {"SessionId": "test"}
+    assert response.json.call_count == 0
+
+
+def test_loads_without_orjson(mocker):
+    """Should fall back to `requests` JSON decoding when orjson is not installed."""
+    mocker.patch("elmo.api.client.orjson", None)
+    response = mocker.Mock()
+    response.json.return_value = {"SessionId": "test"}
+    assert _loads(response) == {"SessionId": "test"}
+    assert response.json.call_count == 1
@@ -116,3 +116,47 @@ def test_require_lock_not_valid():
     client = TestClient()
     with pytest.raises(LockNotAcquired):
         client.action()
+
+
+def test_require_session_preserves_metadata():
+    """Should preserve the name and the docstring of the decorated method."""
+
+    @require_session
+    def action(self):
+        """Action docstring."""
+
+    assert action.__name__ == "action"
+    assert action.__doc__ == "Action docstring."
+
+
+def test_require_lock_preserves_metadata():
+    """Should preserve the name and the docstring of the decorated method."""
+
+    @require_lock
+    def action(self):
+        """Action docstring."""
+
+    assert action.__name__ == "action"
+    assert action.__doc__ == "Action docstring."
+
+
+def test_require_lock_not_valid_clears_owner():
+    """Should forget the lock owner when the lock is released after a 403."""
+
+    class TestClient:
+        def __init__(self):
+            self._lock = Lock()
+            self._lock.acquire()
+            self._lock_owner = 42
+
+        @require_lock
+        def action(self):
+            r = Response()
+            r.status_code = 403
+            raise HTTPError(response=r)
+
+    client = TestClient()
+    with pytest.raises(LockNotAcquired):
+        client.action()
+    assert client._lock_owner is None
+    assert not client._lock.locked()
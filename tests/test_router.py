@@ -8,3 +8,24 @@ def test_https_is_required():
     """Should accept only HTTPS URLs."""
     with pytest.raises(ValidationError):
         Router("http://connect.elmospa.com")
+
+
+def test_endpoints_use_base_url():
+    """Should build all endpoints from the given base URL."""
+    router = Router("https://example.com")
+    assert router.auth == "https://example.com/api/login"
+    assert router.descriptions == "https://example.com/api/strings"
+    assert router.update == "https://example.com/api/updates"
+    assert router.status == "https://example.com/api/statusadv"
+    assert router.lock == "https://example.com/api/panel/syncLogin"
+    assert router.unlock == "https://example.com/api/panel/syncLogout"
+    assert router.send_command == "https://example.com/api/panel/syncSendCommand"
+    assert router.sectors == "https://example.com/api/areas"
+    assert router.inputs == "https://example.com/api/inputs"
+    assert router.outputs == "https://example.com/api/outputs"
+
+
+def test_router_has_no_instance_dict():
+    """Should store endpoints in slots, without a per-instance `__dict__`."""
+    router = Router("https://example.com")
+    assert not hasattr(router, "__dict__")
@@ -58,9 +58,17 @@ def test_camel_to_snake_case_all_uppercase():
     assert _camel_to_snake_case("UPPERCASE") == "uppercase"
 
 
-def test_camel_to_snake_case_cache(mocker):
-    """Test that cached values don't call regex twice."""
-    mocked_sub = mocker.patch("re.sub")
+def test_camel_to_snake_case_cache():
+    """Test that cached values don't run the conversion twice."""
+    _camel_to_snake_case.cache_clear()
     _camel_to_snake_case("camelCase")
     _camel_to_snake_case("camelCase")
-    assert mocked_sub.call_count == 4
+    info = _camel_to_snake_case.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_camel_to_snake_case_acronym():
+    """Test conversion of a camel-cased string ending with an acronym."""
+    assert _camel_to_snake_case("SourceIP") == "source_ip"
+    assert _camel_to_snake_case("LoginWithoutUserID") == "login_without_user_id"